@@ -8,18 +8,22 @@ SQUIDBOT_ prefix (e.g., SQUIDBOT_LLM__API_KEY).
 
 from __future__ import annotations
 
-import json
+import re
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 DEFAULT_CONFIG_PATH = Path.home() / ".squidbot" / "config.json"
 
+_HHMM_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})$")
+
 
 class LLMProviderConfig(BaseModel):
     """API endpoint credentials for an LLM provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_base: str
     api_key: str = ""
     supports_reasoning_content: bool = False
@@ -28,6 +32,8 @@ class LLMProviderConfig(BaseModel):
 class LLMModelConfig(BaseModel):
     """A named model definition referencing a provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str
     model: str
     max_tokens: int = 8192
@@ -37,6 +43,8 @@ class LLMModelConfig(BaseModel):
 class LLMPoolEntry(BaseModel):
     """One entry in a pool's fallback list — references a named model."""
 
+    model_config = ConfigDict(frozen=True)
+
     model: str
 
 
@@ -52,6 +60,8 @@ class LLMConfig(BaseModel):
 class HeartbeatConfig(BaseModel):
     """Configuration for the periodic heartbeat service."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     interval_minutes: int = 30
     prompt: str = (
@@ -64,6 +74,22 @@ class HeartbeatConfig(BaseModel):
     timezone: str = "local"  # IANA tz name or "local" (host timezone)
     pool: str = ""  # empty = use llm.default_pool
 
+    @field_validator("active_hours_start", "active_hours_end")
+    @classmethod
+    def _validate_hhmm(cls, value: str) -> str:
+        """
+        Require an "H:MM" or "HH:MM" time between 00:00 and 24:00.
+
+        Raises:
+            ValueError: If the value is not a valid HH:MM time.
+        """
+        match = _HHMM_PATTERN.match(value)
+        if match is not None:
+            hours, minutes = int(match.group(1)), int(match.group(2))
+            if minutes <= 59 and (hours <= 23 or (hours == 24 and minutes == 0)):
+                return value
+        raise ValueError(f"expected HH:MM between 00:00 and 24:00, got {value!r}")
+
 
 class AgentConfig(BaseModel):
     """Configuration for agent behavior."""
@@ -105,6 +131,8 @@ class McpServerConfig(BaseModel):
 class SpawnProfile(BaseModel):
     """Configuration for a named sub-agent profile."""
 
+    model_config = ConfigDict(frozen=True)
+
     system_prompt: str = ""
     system_prompt_file: str = ""  # filename relative to workspace
     bootstrap_files: list[str] = Field(default_factory=list)  # [] = default allowlist
@@ -198,6 +226,8 @@ class SkillsConfig(BaseModel):
 class OwnerAliasEntry(BaseModel):
     """A single owner alias, optionally scoped to a specific channel."""
 
+    model_config = ConfigDict(frozen=True)
+
     address: str
     channel: str | None = None
 
@@ -288,8 +318,8 @@ class Settings(BaseModel):
         """
         if not path.exists():
             return cls()
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls.model_validate(data)
+        # model_validate_json parses and validates in a single pydantic-core pass.
+        return cls.model_validate_json(path.read_text(encoding="utf-8"))
 
     def save(self, path: Path = DEFAULT_CONFIG_PATH) -> None:
         """Persist settings to a JSON file."""
@@ -7,7 +7,8 @@ commands and agent tools can reuse one implementation.
 
 from __future__ import annotations
 
-import uuid
+import secrets
+from dataclasses import replace
 from datetime import datetime
 
 from squidbot.core.models import CronJob
@@ -16,7 +17,7 @@ from squidbot.core.scheduler import parse_schedule
 
 def generate_job_id() -> str:
     """Generate an 8-character cron job identifier."""
-    return uuid.uuid4().hex[:8]
+    return secrets.token_hex(4)
 
 
 def validate_job(job: CronJob, *, now: datetime | None = None) -> str | None:
@@ -55,35 +56,30 @@ def add_job(jobs: list[CronJob], job: CronJob, *, now: datetime | None = None) -
     return [*jobs, job]
 
 
+def _find_job(jobs: list[CronJob], job_id: str) -> int | None:
+    """Return the index of the job with ``job_id``, or None. Job IDs are unique."""
+    for index, job in enumerate(jobs):
+        if job.id == job_id:
+            return index
+    return None
+
+
 def remove_job(jobs: list[CronJob], job_id: str) -> tuple[list[CronJob], bool]:
     """Return a new list with a job removed by ID."""
-    updated = [job for job in jobs if job.id != job_id]
-    return updated, len(updated) != len(jobs)
+    index = _find_job(jobs, job_id)
+    if index is None:
+        return list(jobs), False
+    return jobs[:index] + jobs[index + 1 :], True
 
 
 def set_enabled(jobs: list[CronJob], job_id: str, enabled: bool) -> tuple[list[CronJob], bool]:
     """Return a new list with one job's enabled flag updated."""
-    updated: list[CronJob] = []
-    found = False
-    for job in jobs:
-        if job.id != job_id:
-            updated.append(job)
-            continue
-        found = True
-        updated.append(
-            CronJob(
-                id=job.id,
-                name=job.name,
-                message=job.message,
-                schedule=job.schedule,
-                channel=job.channel,
-                enabled=enabled,
-                timezone=job.timezone,
-                last_run=job.last_run,
-                metadata=dict(job.metadata),
-            )
-        )
-    return updated, found
+    index = _find_job(jobs, job_id)
+    if index is None:
+        return list(jobs), False
+    job = jobs[index]
+    updated = replace(job, enabled=enabled, metadata=dict(job.metadata))
+    return [*jobs[:index], updated, *jobs[index + 1 :]], True
 
 
 def format_jobs(jobs: list[CronJob]) -> str:
@@ -72,6 +72,12 @@ def _is_heartbeat_empty(content: str | None) -> bool:
     return True
 
 
+def _minutes_since_midnight(hhmm: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight ("24:00" -> 1440)."""
+    hours, minutes = (int(part) for part in hhmm.split(":"))
+    return hours * 60 + minutes
+
+
 class LastChannelTracker:
     """
     Tracks the most recently active channel and session.
@@ -162,6 +168,10 @@ class HeartbeatService:
         self._config = config
         self._llm_override = llm_override
         self._extra_tools_factory = extra_tools_factory
+        # HeartbeatConfig is frozen, so parse the window once here. Its HH:MM validator only
+        # runs on construction; a config made with model_copy(update=...) is not re-checked.
+        self._start_minutes = _minutes_since_midnight(config.active_hours_start)
+        self._end_minutes = _minutes_since_midnight(config.active_hours_end)
 
     def _is_in_active_hours(self, now: datetime | None = None) -> bool:
         """
@@ -186,18 +196,12 @@ class HeartbeatService:
                 logger.warning("heartbeat: unknown timezone {!r}, falling back to local", tz_name)
                 local_now = now.astimezone()
 
-        start_h, start_m = (int(x) for x in self._config.active_hours_start.split(":"))
-        end_h, end_m = (int(x) for x in self._config.active_hours_end.split(":"))
-
         # Zero-width window: always outside
-        if (start_h, start_m) == (end_h, end_m):
+        if self._start_minutes == self._end_minutes:
             return False
 
         current_minutes = local_now.hour * 60 + local_now.minute
-        start_minutes = start_h * 60 + start_m
-        end_minutes = end_h * 60 + end_m if not (end_h == 24 and end_m == 0) else 24 * 60
-
-        return start_minutes <= current_minutes < end_minutes
+        return self._start_minutes <= current_minutes < self._end_minutes
 
     def _read_heartbeat_file(self) -> str | None:
         """
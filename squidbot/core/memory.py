@@ -8,6 +8,7 @@ contains no I/O or external service calls.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from squidbot.core.models import Message
@@ -15,6 +16,7 @@ from squidbot.core.ports import MemoryPort, SkillsPort
 
 if TYPE_CHECKING:
     from squidbot.config.schema import OwnerAliasEntry
+    from squidbot.core.skills import SkillMetadata
 
 
 class MemoryManager:
@@ -63,6 +65,8 @@ class MemoryManager:
         if history_context_messages <= 0:
             raise ValueError("history_context_messages must be > 0")
         self._history_context_messages = history_context_messages
+        # Last skills list and the XML rendered from it; the list rarely changes between turns
+        self._skills_xml_cache: tuple[list[SkillMetadata], str] | None = None
 
     def _is_owner(self, sender_id: str, channel: str) -> bool:
         """
@@ -118,6 +122,17 @@ class MemoryManager:
             sender_id=msg.sender_id,
         )
 
+    def _skills_xml(self, skill_list: list[SkillMetadata]) -> str:
+        """Return the skills XML block, re-rendering only when the skill list changed."""
+        from squidbot.core.skills import build_skills_xml  # noqa: PLC0415
+
+        cached = self._skills_xml_cache
+        if cached is not None and cached[0] == skill_list:
+            return cached[1]
+        xml = build_skills_xml(skill_list)
+        self._skills_xml_cache = (list(skill_list), xml)
+        return xml
+
     async def build_messages(
         self,
         user_message: str,
@@ -136,8 +151,11 @@ class MemoryManager:
         Returns:
             Ordered list of messages ready to send to the LLM.
         """
-        history = await self._storage.load_history(last_n=self._history_context_messages)
-        global_memory = await self._storage.load_global_memory()
+        # The two reads are independent; adapters run them off-loop, so overlap them
+        history, global_memory = await asyncio.gather(
+            self._storage.load_history(last_n=self._history_context_messages),
+            self._storage.load_global_memory(),
+        )
 
         # Label each history message with channel/sender context
         labelled_history = [self._label_message(msg) for msg in history]
@@ -149,10 +167,8 @@ class MemoryManager:
 
         # Inject skills: XML index + full bodies of always-skills
         if self._skills is not None:
-            from squidbot.core.skills import build_skills_xml  # noqa: PLC0415
-
             skill_list = self._skills.list_skills()
-            full_system += f"\n\n{build_skills_xml(skill_list)}"
+            full_system += f"\n\n{self._skills_xml(skill_list)}"
             for skill in skill_list:
                 if skill.always and skill.available:
                     body = self._skills.load_skill_body(skill.name)
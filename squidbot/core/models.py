@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool invocation requested by the LLM."""
 
@@ -31,7 +31,7 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     """A single message in a conversation."""
 
@@ -70,17 +70,18 @@ class Message:
         return d
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Session:
     """A conversation session, identified by channel and sender."""
 
     channel: str
     sender_id: str
     created_at: datetime = field(default_factory=datetime.now, compare=False)
+    # "<channel>:<sender_id>", derived once; the dataclass is frozen so it cannot go stale
+    id: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def id(self) -> str:
-        return f"{self.channel}:{self.sender_id}"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "id", f"{self.channel}:{self.sender_id}")
 
 
 @dataclass
@@ -138,7 +139,7 @@ class CronJob:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Runtime metadata for a session seen since gateway start."""
 
@@ -149,7 +150,7 @@ class SessionInfo:
     message_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelStatus:
     """Runtime status of a channel adapter."""
 
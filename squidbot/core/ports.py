@@ -5,13 +5,14 @@ These are Python Protocol classes defining the contracts that adapters must sati
 The core domain imports ONLY from this file (and models.py) for any external dependency.
 
 Adapters implement these protocols without inheriting from them (structural subtyping).
-mypy verifies conformance statically.
+mypy verifies conformance statically; the protocols are also runtime-checkable so tests
+can assert that a double exposes every port member.
 """
 
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from squidbot.core.models import (
     ChannelStatus,
@@ -27,6 +28,7 @@ from squidbot.core.models import (
 from squidbot.core.skills import SkillMetadata
 
 
+@runtime_checkable
 class LLMPort(Protocol):
     """
     Interface for language model communication.
@@ -59,6 +61,7 @@ class LLMPort(Protocol):
         ...
 
 
+@runtime_checkable
 class ChannelPort(Protocol):
     """
     Interface for inbound/outbound message channels.
@@ -90,6 +93,7 @@ class ChannelPort(Protocol):
         ...
 
 
+@runtime_checkable
 class ToolPort(Protocol):
     """
     Interface for agent tools.
@@ -115,6 +119,7 @@ class ToolPort(Protocol):
         ...
 
 
+@runtime_checkable
 class MemoryPort(Protocol):
     """
     Interface for session state persistence.
@@ -150,6 +155,7 @@ class MemoryPort(Protocol):
         ...
 
 
+@runtime_checkable
 class SkillsPort(Protocol):
     """
     Interface for skill discovery and loading.
@@ -171,6 +177,7 @@ class SkillsPort(Protocol):
         ...
 
 
+@runtime_checkable
 class StatusPort(Protocol):
     """
     Interface for gateway status reporting.
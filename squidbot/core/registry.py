@@ -18,6 +18,18 @@ class ToolRegistry:
         self._tools[tool.name] = tool
         self._cached_definitions = None
 
+    def clone(self) -> ToolRegistry:
+        """
+        Return an independent registry holding the same tool instances.
+
+        Registering into the clone does not affect this registry. The cached
+        definitions tuple is immutable, so it is shared rather than rebuilt.
+        """
+        twin = ToolRegistry()
+        twin._tools = dict(self._tools)
+        twin._cached_definitions = self._cached_definitions
+        return twin
+
     def get_definitions(self) -> list[ToolDefinition]:
         """Return OpenAI-format tool definitions for all registered tools."""
         if self._cached_definitions is None:
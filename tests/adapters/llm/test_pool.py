@@ -10,18 +10,24 @@ from squidbot.adapters.llm.pool import PooledLLMAdapter, _is_auth_error
 from squidbot.core.models import Message
 
 
-def _make_streaming_adapter(chunks: list[str]):
-    """Build a mock LLMPort that yields the given chunks."""
+async def _stream(chunks: list[str]):
+    for chunk in chunks:
+        yield chunk
 
-    class StreamingAdapter:
-        async def chat(self, messages, tools, *, stream=True):
-            async def _gen():
-                for chunk in chunks:
-                    yield chunk
 
-            return _gen()
+class _StreamingAdapter:
+    """LLMPort test double that streams a fixed list of chunks."""
 
-    return StreamingAdapter()
+    def __init__(self, chunks: list[str]) -> None:
+        self._chunks = chunks
+
+    async def chat(self, messages, tools, *, stream=True):
+        return _stream(self._chunks)
+
+
+def _make_streaming_adapter(chunks: list[str]):
+    """Build a mock LLMPort that yields the given chunks."""
+    return _StreamingAdapter(chunks)
 
 
 def _make_failing_adapter(exc: Exception):
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import math
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from squidbot.adapters.persistence import jsonl as jsonl_module
 from squidbot.adapters.persistence.jsonl import JsonlMemory
-from squidbot.core.models import CronJob, Message
+from squidbot.core.models import CronJob, Message, ToolCall
 
 
 @pytest.mark.asyncio
@@ -72,8 +77,7 @@ async def test_load_history_tolerates_invalid_utf8_bytes(tmp_path: Path) -> None
     assert [message.content for message in history] == ["before-bytes", "after-bytes"]
 
 
-@pytest.mark.asyncio
-async def test_summary_and_cursor_api_removed(tmp_path: Path) -> None:
+def test_summary_and_cursor_api_removed(tmp_path: Path) -> None:
     storage = JsonlMemory(base_dir=tmp_path)
     assert not hasattr(storage, "load_global_summary")
     assert not hasattr(storage, "save_global_summary")
@@ -106,6 +110,31 @@ async def test_message_reasoning_content_roundtrip(tmp_path: Path) -> None:
     assert loaded[0].reasoning_content == "tool selection reasoning"
 
 
+@pytest.mark.asyncio
+async def test_message_with_non_ascii_and_lone_surrogate_roundtrip(tmp_path: Path) -> None:
+    storage = JsonlMemory(base_dir=tmp_path)
+    await storage.append_message(Message(role="user", content="grüße 🦑"))
+    await storage.append_message(Message(role="tool", content="bad \udcff byte"))
+    loaded = await storage.load_history()
+    assert [m.content for m in loaded] == ["grüße 🦑", "bad \udcff byte"]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_non_finite_float_arguments_roundtrip(tmp_path: Path) -> None:
+    storage = JsonlMemory(base_dir=tmp_path)
+    arguments = {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")}
+    tool_call = ToolCall(id="tc_1", name="calc", arguments=arguments)
+    await storage.append_message(Message(role="assistant", content="", tool_calls=[tool_call]))
+
+    loaded = await storage.load_history()
+
+    assert loaded[0].tool_calls is not None
+    loaded_args = loaded[0].tool_calls[0].arguments
+    assert math.isnan(loaded_args["nan"])
+    assert loaded_args["inf"] == float("inf")
+    assert loaded_args["ninf"] == float("-inf")
+
+
 @pytest.mark.asyncio
 async def test_global_memory_roundtrip(tmp_path: Path) -> None:
     storage = JsonlMemory(base_dir=tmp_path)
@@ -173,14 +202,15 @@ class _CountingBinaryFile:
 
 
 def _write_history_fixture(path: Path, total_messages: int) -> None:
-    with path.open("wb") as f:
-        for i in range(total_messages):
-            payload = {
-                "role": "user",
-                "content": f"m{i:06d}",
-                "timestamp": "2026-01-01T00:00:00",
-            }
-            f.write(json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n")
+    # Serialize one record and stamp the counter in, instead of json.dumps per line
+    line = (
+        json.dumps(
+            {"role": "user", "content": "m%06d", "timestamp": "2026-01-01T00:00:00"},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        + b"\n"
+    )
+    path.write_bytes(b"".join(line % i for i in range(total_messages)))
 
 
 @pytest.mark.asyncio
@@ -228,3 +258,51 @@ async def test_load_history_last_n_skips_malformed_trailing_lines(tmp_path: Path
     assert len(history) == 80
     assert history[0].content == "m000120"
     assert history[-1].content == "m000199"
+
+
+@pytest.mark.asyncio
+async def test_save_cron_jobs_skips_unchanged_rewrite(tmp_path: Path) -> None:
+    storage = JsonlMemory(base_dir=tmp_path)
+    job = CronJob(id="job-1", name="Daily", message="ping", schedule="0 9 * * *", channel="cli")
+    cron_path = tmp_path / "cron" / "jobs.json"
+
+    await storage.save_cron_jobs([job])
+    inode = cron_path.stat().st_ino
+    await storage.save_cron_jobs([job])
+    assert cron_path.stat().st_ino == inode
+
+    # An external edit must not be masked by the cached content
+    cron_path.write_text("[]", encoding="utf-8")
+    await storage.save_cron_jobs([job])
+    assert [j.id for j in await storage.load_cron_jobs()] == ["job-1"]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_cron_saves_do_not_mask_a_later_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = JsonlMemory(base_dir=tmp_path)
+    jobs_a = [CronJob(id="a", name="A", message="a", schedule="0 9 * * *", channel="cli")]
+    jobs_b = [CronJob(id="b", name="B", message="b", schedule="0 9 * * *", channel="cli")]
+    a_written = threading.Event()
+    original_write = jsonl_module._atomic_write_text
+
+    def slow_write(path: Path, content: str) -> Any:
+        written = original_write(path, content)
+        if '"id": "a"' in content:
+            a_written.set()
+            # Leave a window between A's write and A recording its cache key
+            time.sleep(0.2)
+        return written
+
+    monkeypatch.setattr(jsonl_module, "_atomic_write_text", slow_write)
+    save_a = asyncio.create_task(storage.save_cron_jobs(jobs_a))
+    # Start save B only once save A has replaced the file
+    assert await asyncio.to_thread(a_written.wait, 5)
+    await storage.save_cron_jobs(jobs_b)
+    await save_a
+    assert [j.id for j in await storage.load_cron_jobs()] == ["b"]
+
+    # Re-saving A must rewrite the file, not match a key recorded for B's contents
+    await storage.save_cron_jobs(jobs_a)
+    assert [j.id for j in await storage.load_cron_jobs()] == ["a"]
@@ -7,29 +7,24 @@ from unittest.mock import patch
 
 import pytest
 
+from squidbot.config.schema import (
+    LLMModelConfig,
+    LLMPoolEntry,
+    LLMProviderConfig,
+    Settings,
+)
 
-def _minimal_llm_settings(s: object) -> None:
+
+def _minimal_llm_settings(s: Settings) -> None:
     """Populate a Settings instance with the minimal valid LLM config."""
-    from squidbot.config.schema import (
-        LLMModelConfig,
-        LLMPoolEntry,
-        LLMProviderConfig,
-    )
-
-    s.llm.providers["default"] = LLMProviderConfig(  # type: ignore[attr-defined]
-        api_base="https://api.test", api_key="sk-test"
-    )
-    s.llm.models["default"] = LLMModelConfig(  # type: ignore[attr-defined]
-        provider="default", model="test-model"
-    )
-    s.llm.pools["default"] = [LLMPoolEntry(model="default")]  # type: ignore[attr-defined]
-    s.llm.default_pool = "default"  # type: ignore[attr-defined]
+    s.llm.providers["default"] = LLMProviderConfig(api_base="https://api.test", api_key="sk-test")
+    s.llm.models["default"] = LLMModelConfig(provider="default", model="test-model")
+    s.llm.pools["default"] = [LLMPoolEntry(model="default")]
+    s.llm.default_pool = "default"
 
 
 @pytest.fixture
 def settings_search_history_enabled():
-    from squidbot.config.schema import Settings
-
     s = Settings()
     _minimal_llm_settings(s)
     s.tools.search_history.enabled = True
@@ -38,8 +33,6 @@ def settings_search_history_enabled():
 
 @pytest.fixture
 def settings_search_history_disabled():
-    from squidbot.config.schema import Settings
-
     s = Settings()
     _minimal_llm_settings(s)
     s.tools.search_history.enabled = False
@@ -7,29 +7,25 @@ from unittest.mock import patch
 
 import pytest
 
+from squidbot.config.schema import (
+    LLMModelConfig,
+    LLMPoolEntry,
+    LLMProviderConfig,
+    Settings,
+    SpawnProfile,
+)
 
-def _minimal_llm_settings(s: object) -> None:
+
+def _minimal_llm_settings(s: Settings) -> None:
     """Populate a Settings instance with the minimal valid LLM config."""
-    from squidbot.config.schema import (
-        LLMModelConfig,
-        LLMPoolEntry,
-        LLMProviderConfig,
-    )
-
-    s.llm.providers["default"] = LLMProviderConfig(  # type: ignore[attr-defined]
-        api_base="https://api.test", api_key="sk-test"
-    )
-    s.llm.models["default"] = LLMModelConfig(  # type: ignore[attr-defined]
-        provider="default", model="test-model"
-    )
-    s.llm.pools["default"] = [LLMPoolEntry(model="default")]  # type: ignore[attr-defined]
-    s.llm.default_pool = "default"  # type: ignore[attr-defined]
+    s.llm.providers["default"] = LLMProviderConfig(api_base="https://api.test", api_key="sk-test")
+    s.llm.models["default"] = LLMModelConfig(provider="default", model="test-model")
+    s.llm.pools["default"] = [LLMPoolEntry(model="default")]
+    s.llm.default_pool = "default"
 
 
 @pytest.fixture
 def settings_with_spawn():
-    from squidbot.config.schema import Settings, SpawnProfile
-
     s = Settings()
     _minimal_llm_settings(s)
     s.tools.spawn.enabled = True
@@ -41,8 +37,6 @@ def settings_with_spawn():
 
 @pytest.fixture
 def settings_spawn_disabled():
-    from squidbot.config.schema import Settings
-
     s = Settings()
     _minimal_llm_settings(s)
     s.tools.spawn.enabled = False
@@ -94,8 +88,6 @@ async def test_profile_injected_in_system_prompt(settings_with_spawn, tmp_path):
 
 
 async def test_no_profile_injection_when_no_profiles(tmp_path):
-    from squidbot.config.schema import Settings
-
     s = Settings()
     _minimal_llm_settings(s)
     s.tools.spawn.enabled = True
@@ -2,41 +2,41 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import Any
+
+import pytest
 
 from squidbot.adapters.tools.shell import ShellTool
 
+# ShellTool is stateless and unrestricted here, so every test can share one instance
+_TOOL = ShellTool(workspace=None, restrict_to_workspace=False)
+
 
 class TestShellToolMissingArgs:
-    async def test_no_command_key_returns_error(self, tmp_path: Path) -> None:
-        tool = ShellTool(workspace=tmp_path, restrict_to_workspace=False)
-        result = await tool.execute()
+    async def test_no_command_key_returns_error(self) -> None:
+        result = await _TOOL.execute()
         assert result.is_error
         assert "command is required" in result.content
 
-    async def test_command_none_returns_error(self, tmp_path: Path) -> None:
-        tool = ShellTool(workspace=tmp_path, restrict_to_workspace=False)
-        result = await tool.execute(command=None)
+    async def test_command_none_returns_error(self) -> None:
+        result = await _TOOL.execute(command=None)
         assert result.is_error
         assert "command is required" in result.content
 
 
 class TestShellToolExecutes:
-    async def test_simple_command_returns_output(self, tmp_path: Path) -> None:
-        tool = ShellTool(workspace=tmp_path, restrict_to_workspace=False)
-        result = await tool.execute(command="echo hello")
-        assert not result.is_error
-        assert "hello" in result.content
-
-    async def test_nonzero_exit_returns_error(self, tmp_path: Path) -> None:
-        tool = ShellTool(workspace=tmp_path, restrict_to_workspace=False)
-        result = await tool.execute(command="exit 1")
-        assert result.is_error
-        assert "Exit code" in result.content
-
-    async def test_invalid_timeout_falls_back_to_default(self, tmp_path: Path) -> None:
-        """A non-integer timeout value should not crash — falls back to 30s."""
-        tool = ShellTool(workspace=tmp_path, restrict_to_workspace=False)
-        result = await tool.execute(command="echo ok", timeout=None)
-        assert not result.is_error
-        assert "ok" in result.content
+    @pytest.mark.parametrize(
+        ("kwargs", "is_error", "expected"),
+        [
+            pytest.param({"command": "echo hello"}, False, "hello", id="simple-command"),
+            pytest.param({"command": "exit 1"}, True, "Exit code", id="nonzero-exit"),
+            # A non-integer timeout value should not crash — falls back to 30s
+            pytest.param(
+                {"command": "echo ok", "timeout": None}, False, "ok", id="invalid-timeout"
+            ),
+        ],
+    )
+    async def test_execute(self, kwargs: dict[str, Any], is_error: bool, expected: str) -> None:
+        result = await _TOOL.execute(**kwargs)
+        assert result.is_error is is_error
+        assert expected in result.content
@@ -28,7 +28,7 @@ def session() -> Session:
     return Session(channel="test", sender_id="user1")
 
 
-async def test_collecting_channel_not_streaming():
+def test_collecting_channel_not_streaming():
     ch = CollectingChannel()
     assert ch.streaming is False
 
@@ -294,7 +294,7 @@ async def test_spawn_tool_registers_job(tmp_path):
     assert job_id in job_store.all_job_ids()
 
 
-async def test_spawn_tool_profile_enum_in_definition(tmp_path):
+def test_spawn_tool_profile_enum_in_definition(tmp_path):
     llm = MagicMock()
     registry = _make_mock_registry([])
     profiles = {
@@ -317,7 +317,7 @@ async def test_spawn_tool_profile_enum_in_definition(tmp_path):
     assert set(profile_param["enum"]) == {"coder", "writer"}
 
 
-async def test_spawn_tool_no_profile_enum_when_no_profiles(tmp_path):
+def test_spawn_tool_no_profile_enum_when_no_profiles(tmp_path):
     llm = MagicMock()
     registry = _make_mock_registry([])
     factory = SubAgentFactory(
@@ -24,30 +24,63 @@ from squidbot.core.models import (
 from squidbot.core.registry import ToolRegistry
 
 
+class _OneShotAIter:
+    """Async iterator that yields a single pre-built value, then stops."""
+
+    def __init__(self, value) -> None:
+        self._value = value
+        self._consumed = False
+
+    def __aiter__(self) -> _OneShotAIter:
+        return self
+
+    async def __anext__(self):
+        if self._consumed:
+            raise StopAsyncIteration
+        self._consumed = True
+        return self._value
+
+
 class ScriptedLLM:
     """LLM test double that returns pre-defined responses."""
 
+    __slots__ = ("_responses", "_index")
+
     def __init__(self, responses: list):
-        self._responses = iter(responses)
+        self._responses = list(responses)
+        self._index = 0
 
     async def chat(self, messages, tools, *, stream=True) -> AsyncIterator:
-        response = next(self._responses)
+        response = self._responses[self._index]
+        self._index += 1
+        return _OneShotAIter(response)
+
 
-        async def _gen():
-            yield response
+class ReasoningLLM:
+    """LLM test double that requests one tool call with reasoning, then replies."""
 
-        return _gen()
+    def __init__(self, tool_call: ToolCall) -> None:
+        self.calls: list[list[Message]] = []
+        self._tool_call = tool_call
+
+    async def chat(self, messages, tools, *, stream=True) -> AsyncIterator:
+        self.calls.append(list(messages))
+        if len(self.calls) == 1:
+            return _OneShotAIter(([self._tool_call], "selected tool after reasoning"))
+        return _OneShotAIter("Done")
 
 
 class InMemoryStorage:
+    __slots__ = ("_history", "_global_memory")
+
     def __init__(self) -> None:
         self._history: list[Message] = []
         self._global_memory: str = ""
 
     async def load_history(self, last_n: int | None = None) -> list[Message]:
         if last_n is None:
-            return list(self._history)
-        return list(self._history[-last_n:])
+            return self._history.copy()
+        return self._history[-last_n:]
 
     async def append_message(self, message: Message) -> None:
         self._history.append(message)
@@ -124,6 +157,10 @@ class PersistExchangeFailingMemory(MemoryManager):
 
 
 SESSION = Session(channel="cli", sender_id="local")
+ECHO_WORLD_CALL = ToolCall(id="tc_1", name="echo", arguments={"text": "world"})
+
+_ECHO_REGISTRY = ToolRegistry()
+_ECHO_REGISTRY.register(EchoTool())
 
 
 @pytest.fixture
@@ -136,6 +173,12 @@ def memory(storage):
     return MemoryManager(storage=storage)
 
 
+@pytest.fixture
+def echo_registry():
+    """A per-test copy of the module-level EchoTool registry."""
+    return _ECHO_REGISTRY.clone()
+
+
 async def test_simple_text_response(storage, memory):
     llm = ScriptedLLM(["Hello from the bot!"])
     channel = CollectingChannel()
@@ -160,42 +203,18 @@ async def test_streaming_channel_receives_chunks(storage, memory):
     assert len(channel.sent) >= 1
 
 
-async def test_tool_call_then_text(storage, memory):
-    tool_call = ToolCall(id="tc_1", name="echo", arguments={"text": "world"})
-    llm = ScriptedLLM([[tool_call], "Result received!"])
-    registry = ToolRegistry()
-    registry.register(EchoTool())
+async def test_tool_call_then_text(storage, memory, echo_registry):
+    llm = ScriptedLLM([[ECHO_WORLD_CALL], "Result received!"])
     channel = CollectingChannel()
-    loop = AgentLoop(llm=llm, memory=memory, registry=registry, system_prompt="You are a bot.")
+    loop = AgentLoop(llm=llm, memory=memory, registry=echo_registry, system_prompt="You are a bot.")
     await loop.run(SESSION, "Please echo world", channel)
     assert any("Result received!" in message.text for message in channel.sent)
 
 
-async def test_tool_call_round_preserves_reasoning_content(storage, memory):
-    tool_call = ToolCall(id="tc_1", name="echo", arguments={"text": "world"})
-
-    class ReasoningLLM:
-        def __init__(self) -> None:
-            self.calls: list[list[Message]] = []
-            self._turn = 0
-
-        async def chat(self, messages, tools, *, stream=True) -> AsyncIterator:
-            self.calls.append(list(messages))
-            self._turn += 1
-
-            async def _gen():
-                if self._turn == 1:
-                    yield ([tool_call], "selected tool after reasoning")
-                    return
-                yield "Done"
-
-            return _gen()
-
-    llm = ReasoningLLM()
-    registry = ToolRegistry()
-    registry.register(EchoTool())
+async def test_tool_call_round_preserves_reasoning_content(storage, memory, echo_registry):
+    llm = ReasoningLLM(ECHO_WORLD_CALL)
     channel = CollectingChannel()
-    loop = AgentLoop(llm=llm, memory=memory, registry=registry, system_prompt="You are a bot.")
+    loop = AgentLoop(llm=llm, memory=memory, registry=echo_registry, system_prompt="You are a bot.")
 
     await loop.run(SESSION, "Please echo world", channel)
 
@@ -213,7 +232,7 @@ async def test_history_persisted_after_run(storage, memory):
         llm=llm, memory=memory, registry=ToolRegistry(), system_prompt="You are a bot."
     )
     await loop.run(SESSION, "Remember me!", channel)
-    history = await storage.load_history()
+    history = storage._history
     assert len(history) == 2  # user + assistant
     assert history[0].role == "user"
     assert history[1].role == "assistant"
@@ -234,8 +253,8 @@ async def test_run_with_llm_override(storage, memory):
     session = Session(channel="cli", sender_id="u1")
     await loop.run(session, "hello", channel, llm=override_llm)
     assert [message.text for message in channel.sent] == ["from override"]
-    # default_llm should NOT have been called (its iterator is still fresh)
-    assert list(default_llm._responses) == ["from default"]
+    # default_llm should NOT have been called (no scripted response consumed)
+    assert default_llm._responses[default_llm._index :] == ["from default"]
 
 
 async def test_extra_tool_callable_via_run(storage, memory):
@@ -277,16 +296,16 @@ async def test_outbound_metadata_propagated_to_channel(storage, memory):
 async def test_extra_tool_does_not_pollute_registry(storage, memory):
     """extra_tools from one run are not available in the next run."""
     loop = AgentLoop(
-        llm=ScriptedLLM(["ok", "ok"]),
+        llm=ScriptedLLM(["ok"]),
         memory=memory,
         registry=ToolRegistry(),
         system_prompt="test",
     )
     channel = CollectingChannel()
     await loop.run(SESSION, "first", channel, extra_tools=[EchoTool()])
-    # Second run without extra_tools: registry still empty
+    # The shared registry is what the next run sees: it must still be empty
     definitions = loop._registry.get_definitions()
-    assert not any(d.name == "echo" for d in definitions)
+    assert "echo" not in {d.name for d in definitions}
 
 
 async def test_run_degrades_when_build_messages_fails(storage) -> None:
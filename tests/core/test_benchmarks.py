@@ -0,0 +1,80 @@
+"""Micro-benchmarks for hot core helpers.
+
+Benchmarks are disabled by default (``--benchmark-disable`` in pyproject), so a
+plain test run executes each body once as a smoke test. Measure with::
+
+    uv run pytest tests/core/test_benchmarks.py --benchmark-enable --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+from squidbot.core.cron_ops import format_jobs, validate_job
+from squidbot.core.heartbeat import _is_heartbeat_empty
+from squidbot.core.memory import MemoryManager
+from squidbot.core.models import CronJob, Message
+
+# ~5 KB of headings, comments and empty checkboxes: the worst case for the
+# emptiness scan because no line short-circuits it.
+_LARGE_EMPTY_HEARTBEAT = (
+    "# Heartbeat\n\n<!-- add tasks below -->\n" + "## Section\n\n- [ ]\n* [x] done\n\n" * 150
+)
+
+_NOW = datetime(2026, 2, 27, 9, 0, tzinfo=UTC)
+
+
+class _StaticStorage:
+    """Read-only storage double holding a fixed history and memory document."""
+
+    def __init__(self, history: list[Message], global_memory: str) -> None:
+        self._history = history
+        self._global_memory = global_memory
+
+    async def load_history(self, last_n: int | None = None) -> list[Message]:
+        return self._history[-last_n:] if last_n else list(self._history)
+
+    async def load_global_memory(self) -> str:
+        return self._global_memory
+
+
+def _job(index: int) -> CronJob:
+    return CronJob(
+        id=f"{index:08x}",
+        name=f"Job {index}",
+        message="Good morning",
+        schedule="0 9 * * 1-5",
+        channel="email:user@example.com",
+        timezone="Europe/Berlin",
+    )
+
+
+def test_is_heartbeat_empty_benchmark(benchmark) -> None:
+    assert benchmark(_is_heartbeat_empty, _LARGE_EMPTY_HEARTBEAT) is True
+
+
+def test_validate_job_benchmark(benchmark) -> None:
+    assert benchmark(validate_job, _job(0), now=_NOW) is None
+
+
+def test_format_jobs_benchmark(benchmark) -> None:
+    jobs = [_job(index) for index in range(50)]
+    assert benchmark(format_jobs, jobs).count("\n") == 50 * 3 - 1
+
+
+def test_build_messages_benchmark(benchmark) -> None:
+    history = [
+        Message(role="user", content=f"message {i}", channel="matrix", sender_id="@alex:m.org")
+        for i in range(200)
+    ]
+    storage = _StaticStorage(history, global_memory="- prefers concise replies\n" * 40)
+    manager = MemoryManager(storage=storage)  # type: ignore[arg-type]
+    loop = asyncio.new_event_loop()
+    try:
+        messages = benchmark(
+            lambda: loop.run_until_complete(manager.build_messages("hi", "You are a bot."))
+        )
+    finally:
+        loop.close()
+    assert len(messages) == 80 + 2
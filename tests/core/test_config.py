@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from pydantic import ValidationError
 
 from squidbot.config.schema import (
     AgentConfig,
@@ -9,6 +10,7 @@ from squidbot.config.schema import (
     LLMModelConfig,
     LLMPoolEntry,
     LLMProviderConfig,
+    McpServerConfig,
     Settings,
     SpawnProfile,
     SpawnSettings,
@@ -64,37 +66,70 @@ def test_heartbeat_config_pool_default():
     assert cfg.pool == ""
 
 
-def test_spawn_profile_pool_default():
-    p = SpawnProfile()
-    assert p.pool == ""
-
-
-def test_spawn_profile_with_pool():
-    p = SpawnProfile(system_prompt="You are a coder.", pool="fast")
-    assert p.pool == "fast"
+@pytest.mark.parametrize(
+    ("model", "field", "value"),
+    [
+        (HeartbeatConfig(), "pool", "fast"),
+        (SpawnProfile(), "pool", "fast"),
+        (LLMPoolEntry(model="opus"), "model", "other"),
+    ],
+)
+def test_leaf_config_models_are_frozen(model, field, value):
+    with pytest.raises(ValidationError):
+        setattr(model, field, value)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "field", "expected"),
+    [
+        ({}, "pool", ""),
+        ({"system_prompt": "You are a coder.", "pool": "fast"}, "pool", "fast"),
+        ({"system_prompt": "You are a coder."}, "system_prompt", "You are a coder."),
+        ({"tools": ["shell"]}, "tools", ["shell"]),
+        ({}, "tools", []),  # empty = inherit all
+        ({}, "bootstrap_files", []),
+        ({}, "system_prompt_file", ""),
+        (
+            {"bootstrap_files": ["SOUL.md", "AGENTS.md"]},
+            "bootstrap_files",
+            ["SOUL.md", "AGENTS.md"],
+        ),
+        ({"system_prompt_file": "RESEARCHER.md"}, "system_prompt_file", "RESEARCHER.md"),
+    ],
+)
+def test_spawn_profile_fields(kwargs, field, expected):
+    p = SpawnProfile(**kwargs)
+    assert getattr(p, field) == expected
 
 
-def test_settings_loads_from_json_file(tmp_path):
+@pytest.fixture(scope="session")
+def loaded_settings(tmp_path_factory):
+    """Write a config file once and load it into Settings for the whole session."""
     config = {"llm": {"default_pool": "default"}}
-    config_file = tmp_path / "config.json"
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
     config_file.write_text(json.dumps(config))
-    settings = Settings.load(config_file)
-    assert settings.llm.default_pool == "default"
+    return Settings.load(config_file)
 
 
-def test_matrix_channel_disabled_by_default():
-    settings = Settings()
-    assert settings.channels.matrix.enabled is False
+def test_settings_loads_from_json_file(loaded_settings):
+    assert loaded_settings.llm.default_pool == "default"
 
 
-def test_email_channel_disabled_by_default():
-    settings = Settings()
-    assert settings.channels.email.enabled is False
+@pytest.fixture(scope="module")
+def default_settings():
+    """A single default Settings tree shared by read-only default checks."""
+    return Settings()
 
 
-def test_mcp_server_config_stdio_defaults():
-    from squidbot.config.schema import McpServerConfig
+def test_matrix_channel_disabled_by_default(default_settings):
+    assert default_settings.channels.matrix.enabled is False
+
 
+def test_email_channel_disabled_by_default(default_settings):
+    assert default_settings.channels.email.enabled is False
+
+
+def test_mcp_server_config_stdio_defaults():
     cfg = McpServerConfig(command="uvx", args=["mcp-server-github"])
     assert cfg.transport == "stdio"
     assert cfg.command == "uvx"
@@ -104,16 +139,12 @@ def test_mcp_server_config_stdio_defaults():
 
 
 def test_mcp_server_config_http():
-    from squidbot.config.schema import McpServerConfig
-
     cfg = McpServerConfig(transport="http", url="http://localhost:8080/mcp")
     assert cfg.transport == "http"
     assert cfg.url == "http://localhost:8080/mcp"
 
 
 def test_tools_config_mcp_servers_typed():
-    from squidbot.config.schema import McpServerConfig, ToolsConfig
-
     cfg = ToolsConfig(mcp_servers={"github": {"command": "uvx", "args": ["mcp-server-github"]}})
     assert isinstance(cfg.mcp_servers["github"], McpServerConfig)
 
@@ -124,25 +155,11 @@ def test_spawn_settings_defaults():
     assert s.profiles == {}
 
 
-def test_spawn_profile_fields():
-    p = SpawnProfile(system_prompt="You are a coder.", tools=["shell"])
-    assert p.system_prompt == "You are a coder."
-    assert p.tools == ["shell"]
-
-
 def test_spawn_settings_in_tools_config():
     cfg = ToolsConfig()
     assert cfg.spawn.enabled is False
 
 
-def test_spawn_profile_empty_tools_means_all():
-    p = SpawnProfile()
-    assert p.tools == []  # empty = inherit all
-
-
-from pydantic import ValidationError  # noqa: E402
-
-
 def test_validation_unknown_default_pool():
     with pytest.raises(ValidationError):
         Settings.model_validate(
@@ -221,32 +238,15 @@ def test_validation_empty_pools_is_valid():
     assert s.llm.pools == {}
 
 
-def test_spawn_profile_bootstrap_files_default():
-    profile = SpawnProfile()
-    assert profile.bootstrap_files == []
-    assert profile.system_prompt_file == ""
-
-
-def test_spawn_profile_bootstrap_files_set():
-    profile = SpawnProfile(bootstrap_files=["SOUL.md", "AGENTS.md"])
-    assert profile.bootstrap_files == ["SOUL.md", "AGENTS.md"]
-
-
-def test_spawn_profile_system_prompt_file():
-    profile = SpawnProfile(system_prompt_file="RESEARCHER.md")
-    assert profile.system_prompt_file == "RESEARCHER.md"
-
-
 def test_agent_config_no_longer_has_system_prompt_file():
     cfg = AgentConfig()
     assert not hasattr(cfg, "system_prompt_file")
 
 
-def test_history_context_messages_defaults():
-    settings = Settings()
-    assert settings.agents.history_context_messages == 80
-    assert not hasattr(settings.agents, "consolidation_threshold")
-    assert not hasattr(settings.agents, "keep_recent_ratio")
+def test_history_context_messages_defaults(default_settings):
+    assert default_settings.agents.history_context_messages == 80
+    assert not hasattr(default_settings.agents, "consolidation_threshold")
+    assert not hasattr(default_settings.agents, "keep_recent_ratio")
 
 
 def test_history_context_messages_must_be_greater_than_zero():
@@ -259,3 +259,16 @@ def test_history_context_messages_must_be_greater_than_zero():
 def test_history_context_messages_valid():
     cfg = AgentConfig(history_context_messages=42)
     assert cfg.history_context_messages == 42
+
+
+@pytest.mark.parametrize("value", ["8", "08.00", "24:30", "25:00", "12:60", ""])
+def test_heartbeat_active_hours_rejects_malformed_time(value):
+    with pytest.raises(ValidationError, match="HH:MM"):
+        HeartbeatConfig(active_hours_start=value)
+    with pytest.raises(ValidationError, match="HH:MM"):
+        HeartbeatConfig(active_hours_end=value)
+
+
+@pytest.mark.parametrize("value", ["00:00", "08:30", "8:00", "23:59", "24:00"])
+def test_heartbeat_active_hours_accepts_valid_time(value):
+    assert HeartbeatConfig(active_hours_start=value).active_hours_start == value
@@ -91,6 +91,16 @@ def test_set_enabled_updates_target_job_only() -> None:
     assert updated[1].enabled is False
 
 
+def test_remove_and_set_enabled_report_missing_job_without_mutating_input() -> None:
+    jobs = [_job(id="a")]
+    assert remove_job(jobs, "missing") == (jobs, False)
+    updated, found = set_enabled(jobs, "missing", False)
+    assert found is False
+    assert updated == jobs
+    assert updated is not jobs
+    assert jobs[0].enabled is True
+
+
 def test_format_jobs_matches_cli_layout() -> None:
     rendered = format_jobs([_job(id="id123")])
     assert "[on] id123  Morning ping" in rendered
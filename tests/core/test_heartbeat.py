@@ -9,53 +9,32 @@ from typing import Any, cast
 
 import pytest
 
-from squidbot.config.schema import HeartbeatConfig
+from squidbot.config.schema import AgentConfig, HeartbeatConfig
 from squidbot.core.heartbeat import HeartbeatService, LastChannelTracker, _is_heartbeat_empty
 from squidbot.core.models import OutboundMessage, Session
 
-
-def test_none_is_empty():
-    assert _is_heartbeat_empty(None) is True
-
-
-def test_empty_string_is_empty():
-    assert _is_heartbeat_empty("") is True
-
-
-def test_blank_lines_only_is_empty():
-    assert _is_heartbeat_empty("\n\n  \n") is True
-
-
-def test_headings_only_is_empty():
-    assert _is_heartbeat_empty("# Heartbeat\n\n## Tasks\n") is True
-
-
-def test_content_is_not_empty():
-    assert _is_heartbeat_empty("- Check inbox") is False
-
-
-def test_heading_plus_content_is_not_empty():
-    assert _is_heartbeat_empty("# Checklist\n- Check inbox") is False
-
-
-def test_html_comment_is_empty():
-    assert _is_heartbeat_empty("<!-- placeholder -->") is True
-
-
-def test_empty_checkbox_is_empty():
-    assert _is_heartbeat_empty("- [ ]\n* [ ]") is True
-
-
-def test_checked_checkbox_is_empty():
-    assert _is_heartbeat_empty("- [x] done") is True
-
-
-def test_checked_checkbox_uppercase_is_empty():
-    assert _is_heartbeat_empty("- [X] done") is True
-
-
-def test_real_task_is_not_empty():
-    assert _is_heartbeat_empty("- [ ] Check urgent emails") is False
+# HeartbeatConfig is frozen, so one validated default can be shared by every test
+_DEFAULT_CFG = HeartbeatConfig()
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        pytest.param(None, True, id="none"),
+        pytest.param("", True, id="empty"),
+        pytest.param("\n\n  \n", True, id="blank-lines"),
+        pytest.param("# Heartbeat\n\n## Tasks\n", True, id="headings-only"),
+        pytest.param("- Check inbox", False, id="content"),
+        pytest.param("# Checklist\n- Check inbox", False, id="heading-plus-content"),
+        pytest.param("<!-- placeholder -->", True, id="html-comment"),
+        pytest.param("- [ ]\n* [ ]", True, id="empty-checkbox"),
+        pytest.param("- [x] done", True, id="checked-checkbox"),
+        pytest.param("- [X] done", True, id="checked-checkbox-uppercase"),
+        pytest.param("- [ ] Check urgent emails", False, id="real-task"),
+    ],
+)
+def test_is_heartbeat_empty(text: str | None, expected: bool):
+    assert _is_heartbeat_empty(text) is expected
 
 
 class _FakeChannel:
@@ -121,46 +100,28 @@ def _make_service(cfg: HeartbeatConfig) -> HeartbeatService:
     )
 
 
-def test_active_hours_always_on():
-    """Default config (00:00-24:00) is always active."""
+@pytest.mark.parametrize(
+    ("start", "end", "when", "expected"),
+    [
+        pytest.param(
+            "00:00", "24:00", datetime(2026, 2, 22, 3, 0, tzinfo=UTC), True, id="always-on"
+        ),
+        pytest.param("08:00", "22:00", datetime(2026, 2, 22, 12, 0, tzinfo=UTC), True, id="inside"),
+        pytest.param(
+            "08:00", "22:00", datetime(2026, 2, 22, 7, 59, tzinfo=UTC), False, id="before"
+        ),
+        pytest.param("08:00", "22:00", datetime(2026, 2, 22, 22, 0, tzinfo=UTC), False, id="after"),
+        # start == end is treated as a zero-width window — always outside
+        pytest.param(
+            "08:00", "08:00", datetime(2026, 2, 22, 8, 0, tzinfo=UTC), False, id="zero-width"
+        ),
+    ],
+)
+def test_active_hours(start: str, end: str, when: datetime, expected: bool):
     svc = _make_service(
-        HeartbeatConfig(active_hours_start="00:00", active_hours_end="24:00", timezone="UTC")
+        HeartbeatConfig(active_hours_start=start, active_hours_end=end, timezone="UTC")
     )
-    dt = datetime(2026, 2, 22, 3, 0, tzinfo=UTC)
-    assert svc._is_in_active_hours(now=dt) is True
-
-
-def test_active_hours_inside_window():
-    svc = _make_service(
-        HeartbeatConfig(active_hours_start="08:00", active_hours_end="22:00", timezone="UTC")
-    )
-    dt = datetime(2026, 2, 22, 12, 0, tzinfo=UTC)
-    assert svc._is_in_active_hours(now=dt) is True
-
-
-def test_active_hours_before_window():
-    svc = _make_service(
-        HeartbeatConfig(active_hours_start="08:00", active_hours_end="22:00", timezone="UTC")
-    )
-    dt = datetime(2026, 2, 22, 7, 59, tzinfo=UTC)
-    assert svc._is_in_active_hours(now=dt) is False
-
-
-def test_active_hours_after_window():
-    svc = _make_service(
-        HeartbeatConfig(active_hours_start="08:00", active_hours_end="22:00", timezone="UTC")
-    )
-    dt = datetime(2026, 2, 22, 22, 0, tzinfo=UTC)
-    assert svc._is_in_active_hours(now=dt) is False
-
-
-def test_active_hours_zero_width_always_skips():
-    """start == end is treated as zero-width window — always outside."""
-    svc = _make_service(
-        HeartbeatConfig(active_hours_start="08:00", active_hours_end="08:00", timezone="UTC")
-    )
-    dt = datetime(2026, 2, 22, 8, 0, tzinfo=UTC)
-    assert svc._is_in_active_hours(now=dt) is False
+    assert svc._is_in_active_hours(now=when) is expected
 
 
 def test_heartbeat_config_defaults():
@@ -173,8 +134,6 @@ def test_heartbeat_config_defaults():
 
 
 def test_heartbeat_config_in_agent_config():
-    from squidbot.config.schema import AgentConfig
-
     cfg = AgentConfig()
     assert isinstance(cfg.heartbeat, HeartbeatConfig)
 
@@ -201,8 +160,6 @@ class _FakeAgentLoop:
         extra_tools: object = None,
     ) -> None:
         self.calls.append((session.id, user_message))
-        from squidbot.core.models import OutboundMessage  # noqa: PLC0415
-
         await channel.send(OutboundMessage(session=session, text=self._response))  # type: ignore[union-attr]
 
 
@@ -210,7 +167,7 @@ async def test_tick_skips_when_tracker_empty(tmp_path):
     agent = _FakeAgentLoop("HEARTBEAT_OK")
     tracker = LastChannelTracker()
     svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
+        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=_DEFAULT_CFG
     )  # type: ignore[arg-type]
     await svc._tick()
     assert agent.calls == []
@@ -234,58 +191,59 @@ async def test_tick_skips_outside_active_hours(tmp_path):
     assert agent.calls == []
 
 
-async def test_tick_skips_empty_heartbeat_file(tmp_path):
-    (tmp_path / "HEARTBEAT.md").write_text("# Checklist\n\n")
-    agent = _FakeAgentLoop("HEARTBEAT_OK")
-    tracker = LastChannelTracker()
-    ch = _FakeChannel()
-    session = Session(channel="cli", sender_id="local")
-    tracker.update(ch, session)  # type: ignore[arg-type]
-    svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
-    await svc._tick()
-    assert agent.calls == []
-
-
-async def test_tick_runs_agent_when_file_absent(tmp_path):
-    agent = _FakeAgentLoop("HEARTBEAT_OK")
-    tracker = LastChannelTracker()
-    ch = _FakeChannel()
-    session = Session(channel="cli", sender_id="local")
-    tracker.update(ch, session)  # type: ignore[arg-type]
-    svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
-    await svc._tick()
-    assert len(agent.calls) == 1
-
-
-async def test_tick_heartbeat_ok_not_delivered(tmp_path):
-    agent = _FakeAgentLoop("HEARTBEAT_OK")
+@pytest.fixture
+def workspace_with_heartbeat(tmp_path, request):
+    """Workspace whose HEARTBEAT.md holds request.param (None leaves the file absent)."""
+    if request.param is not None:
+        (tmp_path / "HEARTBEAT.md").write_text(request.param)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("workspace_with_heartbeat", "agent_response", "expected_calls", "expected_sent"),
+    [
+        pytest.param("# Checklist\n\n", "HEARTBEAT_OK", 0, [], id="empty-file-skips"),
+        pytest.param(None, "HEARTBEAT_OK", 1, [], id="absent-file-ok-not-delivered"),
+        pytest.param(
+            "- Check inbox\n",
+            "You have 3 unread messages.",
+            1,
+            ["You have 3 unread messages."],
+            id="alert-delivered",
+        ),
+        pytest.param(
+            None, "HEARTBEAT_OK\nSome trailing text", 1, [], id="ok-at-start-not-delivered"
+        ),
+        pytest.param(
+            None,
+            "Some text HEARTBEAT_OK more text",
+            1,
+            ["Some text HEARTBEAT_OK more text"],
+            id="ok-in-middle-delivered",
+        ),
+    ],
+    indirect=["workspace_with_heartbeat"],
+)
+async def test_tick_delivery(
+    workspace_with_heartbeat: Path,
+    agent_response: str,
+    expected_calls: int,
+    expected_sent: list[str],
+):
+    agent = _FakeAgentLoop(agent_response)
     tracker = LastChannelTracker()
     ch = _FakeChannel()
     session = Session(channel="cli", sender_id="local")
     tracker.update(ch, session)  # type: ignore[arg-type]
     svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
-    await svc._tick()
-    assert ch.sent == []
-
-
-async def test_tick_alert_delivered(tmp_path):
-    (tmp_path / "HEARTBEAT.md").write_text("- Check inbox\n")
-    agent = _FakeAgentLoop("You have 3 unread messages.")
-    tracker = LastChannelTracker()
-    ch = _FakeChannel()
-    session = Session(channel="cli", sender_id="local")
-    tracker.update(ch, session)  # type: ignore[arg-type]
-    svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
+        agent_loop=cast(Any, agent),
+        tracker=tracker,
+        workspace=workspace_with_heartbeat,
+        config=_DEFAULT_CFG,
+    )
     await svc._tick()
-    assert ch.sent == ["You have 3 unread messages."]
+    assert len(agent.calls) == expected_calls
+    assert ch.sent == expected_sent
 
 
 async def test_tick_alert_delivery_carries_tracker_metadata(tmp_path):
@@ -299,7 +257,7 @@ async def test_tick_alert_delivery_carries_tracker_metadata(tmp_path):
         agent_loop=cast(Any, agent),
         tracker=tracker,
         workspace=tmp_path,
-        config=HeartbeatConfig(),
+        config=_DEFAULT_CFG,
     )  # type: ignore[arg-type]
 
     await svc._tick()
@@ -310,32 +268,6 @@ async def test_tick_alert_delivery_carries_tracker_metadata(tmp_path):
     }
 
 
-async def test_tick_heartbeat_ok_at_start_not_delivered(tmp_path):
-    agent = _FakeAgentLoop("HEARTBEAT_OK\nSome trailing text")
-    tracker = LastChannelTracker()
-    ch = _FakeChannel()
-    session = Session(channel="cli", sender_id="local")
-    tracker.update(ch, session)  # type: ignore[arg-type]
-    svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
-    await svc._tick()
-    assert ch.sent == []
-
-
-async def test_tick_heartbeat_ok_in_middle_is_delivered(tmp_path):
-    agent = _FakeAgentLoop("Some text HEARTBEAT_OK more text")
-    tracker = LastChannelTracker()
-    ch = _FakeChannel()
-    session = Session(channel="cli", sender_id="local")
-    tracker.update(ch, session)  # type: ignore[arg-type]
-    svc = HeartbeatService(
-        agent_loop=cast(Any, agent), tracker=tracker, workspace=tmp_path, config=HeartbeatConfig()
-    )  # type: ignore[arg-type]
-    await svc._tick()
-    assert ch.sent == ["Some text HEARTBEAT_OK more text"]
-
-
 # ---------------------------------------------------------------------------
 # Task 6: HeartbeatService.run()
 # ---------------------------------------------------------------------------
@@ -366,7 +298,7 @@ async def test_heartbeat_uses_llm_override(tmp_path):
         agent_loop=CapturingLoop(),  # type: ignore[arg-type]
         tracker=tracker,
         workspace=tmp_path,
-        config=HeartbeatConfig(),
+        config=_DEFAULT_CFG,
         llm_override=override,
     )
     await svc._tick()
@@ -397,33 +329,37 @@ async def test_heartbeat_no_override_passes_none(tmp_path):
         agent_loop=CapturingLoop(),  # type: ignore[arg-type]
         tracker=tracker,
         workspace=tmp_path,
-        config=HeartbeatConfig(),
+        config=_DEFAULT_CFG,
     )
     await svc._tick()
     assert received_llm == [None]
 
 
-async def test_run_loop_calls_tick_and_stops(tmp_path):
-    """run() should call _tick() at least once and stop when cancelled."""
+async def test_run_loop_calls_tick_and_stops(tmp_path, monkeypatch):
+    """run() should call _tick() after each sleep and stop when cancelled."""
     tick_count = 0
+    sleeps_left = 3
 
     class _CountingService(HeartbeatService):
         async def _tick(self, now: datetime | None = None) -> None:
             nonlocal tick_count
             tick_count += 1
 
-    cfg = HeartbeatConfig(interval_minutes=0)  # 0 minutes = fire immediately
+    async def _sleep_then_cancel(delay: float) -> None:
+        nonlocal sleeps_left
+        if sleeps_left == 0:
+            raise asyncio.CancelledError
+        sleeps_left -= 1
+
+    monkeypatch.setattr("squidbot.core.heartbeat.asyncio.sleep", _sleep_then_cancel)
     svc = _CountingService(
         agent_loop=None,  # type: ignore[arg-type]
         tracker=LastChannelTracker(),
         workspace=tmp_path,
-        config=cfg,
+        config=_DEFAULT_CFG,
     )
 
-    async def _run_briefly() -> None:
-        await asyncio.wait_for(svc.run(), timeout=0.1)
-
-    with pytest.raises((asyncio.TimeoutError, asyncio.CancelledError)):
-        await _run_briefly()
+    with pytest.raises(asyncio.CancelledError):
+        await svc.run()
 
-    assert tick_count >= 1
+    assert tick_count == 3
@@ -8,6 +8,8 @@ exchange persistence with channel/sender metadata.
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -15,6 +17,7 @@ import pytest
 from squidbot.config.schema import OwnerAliasEntry
 from squidbot.core.memory import MemoryManager
 from squidbot.core.models import Message
+from squidbot.core.skills import SkillMetadata
 
 if TYPE_CHECKING:
     from squidbot.core.models import CronJob
@@ -23,6 +26,8 @@ if TYPE_CHECKING:
 class InMemoryStorage:
     """In-memory test double for memory persistence."""
 
+    __slots__ = ("_history", "_global_memory", "_cron_jobs")
+
     def __init__(self) -> None:
         self._history: list[Message] = []
         self._global_memory: str = ""
@@ -31,8 +36,8 @@ class InMemoryStorage:
     async def load_history(self, last_n: int | None = None) -> list[Message]:
         """Return all history or only the last last_n entries."""
         if last_n is None:
-            return list(self._history)
-        return list(self._history[-last_n:])
+            return self._history.copy()
+        return self._history[-last_n:]
 
     async def append_message(self, message: Message) -> None:
         """Append one message to history."""
@@ -65,7 +70,7 @@ async def test_build_messages_includes_your_memory_heading_when_present(
     storage: InMemoryStorage,
 ) -> None:
     """System prompt includes a Your Memory block when global memory is non-empty."""
-    await storage.save_global_memory("User prefers concise replies.")
+    storage._global_memory = "User prefers concise replies."
     manager = MemoryManager(storage=storage)
 
     messages = await manager.build_messages(
@@ -241,6 +246,63 @@ async def test_build_messages_legacy_history_without_channel_or_sender_is_unchan
     assert messages[1].content == "legacy message"
 
 
+async def test_build_messages_loads_history_and_memory_concurrently() -> None:
+    """History and global memory reads overlap instead of running back to back."""
+
+    class RendezvousStorage(InMemoryStorage):
+        __slots__ = ("_memory_started",)
+
+        def __init__(self) -> None:
+            super().__init__()
+            self._memory_started = asyncio.Event()
+
+        async def load_history(self, last_n: int | None = None) -> list[Message]:
+            # Only completes if load_global_memory runs while this read is pending
+            await self._memory_started.wait()
+            return await super().load_history(last_n)
+
+        async def load_global_memory(self) -> str:
+            self._memory_started.set()
+            return await super().load_global_memory()
+
+    manager = MemoryManager(storage=RendezvousStorage())
+
+    messages = await asyncio.wait_for(
+        manager.build_messages(user_message="hi", system_prompt="sys"), timeout=1
+    )
+
+    assert [message.role for message in messages] == ["system", "user"]
+
+
+async def test_build_messages_skills_xml_tracks_skill_list_changes(
+    storage: InMemoryStorage,
+) -> None:
+    """The skills block is reused across turns but reflects an updated skill list."""
+
+    class ListSkills:
+        def __init__(self) -> None:
+            self.skills = [SkillMetadata(name="git", description="Git", location=Path("/s/git"))]
+
+        def list_skills(self) -> list[SkillMetadata]:
+            return list(self.skills)
+
+        def load_skill_body(self, name: str) -> str:
+            return ""
+
+    skills = ListSkills()
+    manager = MemoryManager(storage=storage, skills=skills)
+
+    first = await manager.build_messages(user_message="hi", system_prompt="sys")
+    second = await manager.build_messages(user_message="hi", system_prompt="sys")
+    skills.skills.append(SkillMetadata(name="gh", description="GitHub", location=Path("/s/gh")))
+    third = await manager.build_messages(user_message="hi", system_prompt="sys")
+
+    assert first[0].content == second[0].content
+    assert "<name>git</name>" in first[0].content
+    assert "<name>gh</name>" not in first[0].content
+    assert "<name>gh</name>" in third[0].content
+
+
 async def test_persist_exchange_appends_user_then_assistant_with_metadata(
     storage: InMemoryStorage,
 ) -> None:
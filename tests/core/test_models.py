@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 
+import pytest
+
 from squidbot.core.models import (
     ChannelStatus,
     CronJob,
@@ -22,6 +25,28 @@ def test_message_basic():
     assert isinstance(msg.timestamp, datetime)
 
 
+def test_message_is_immutable_and_slotted():
+    msg = Message(role="user", content="hello")
+    with pytest.raises(FrozenInstanceError):
+        msg.content = "changed"  # type: ignore[misc]
+    assert not hasattr(msg, "__dict__")
+
+
+def test_high_volume_models_are_slotted():
+    tool_call = ToolCall(id="tc_1", name="shell", arguments={})
+    session = Session(channel="cli", sender_id="local")
+    assert not hasattr(tool_call, "__dict__")
+    assert not hasattr(session, "__dict__")
+
+
+def test_session_id_is_derived_once_and_frozen():
+    session = Session(channel="cli", sender_id="local")
+    assert session.id == "cli:local"
+    assert replace(session, sender_id="other").id == "cli:other"
+    with pytest.raises(FrozenInstanceError):
+        session.sender_id = "other"  # type: ignore[misc]
+
+
 def test_message_with_tool_call():
     tool_call = ToolCall(id="tc_1", name="shell", arguments={"command": "ls"})
     msg = Message(role="assistant", content="", tool_calls=[tool_call])
@@ -5,13 +5,9 @@ from squidbot.core.models import CronJob, Message
 
 
 @pytest.fixture
-def tmp_dir(tmp_path):
-    return tmp_path
-
-
-@pytest.fixture
-def memory(tmp_dir):
-    return JsonlMemory(base_dir=tmp_dir)
+def memory(tmp_path):
+    # JsonlMemory creates the directory lazily on first write
+    return JsonlMemory(base_dir=tmp_path / "store")
 
 
 async def test_load_empty_history(memory):
@@ -7,10 +7,13 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 
+import pytest
+
 from squidbot.core.models import (
     InboundMessage,
     Message,
     OutboundMessage,
+    Session,
     ToolDefinition,
     ToolResult,
 )
@@ -38,11 +41,8 @@ class MockChannel:
         self._messages = messages
 
     async def receive(self) -> AsyncIterator[InboundMessage]:
-        async def _gen():
-            for m in self._messages:
-                yield m
-
-        return _gen()
+        for m in self._messages:
+            yield m
 
     async def send(self, message: OutboundMessage) -> None:
         pass
@@ -84,21 +84,6 @@ class MockMemory:
         pass
 
 
-def test_mock_llm_satisfies_protocol():
-    llm: LLMPort = MockLLM()  # type: ignore[assignment]
-    assert llm is not None
-
-
-def test_mock_channel_satisfies_protocol():
-    channel: ChannelPort = MockChannel([])  # type: ignore[assignment]
-    assert channel is not None
-
-
-def test_mock_tool_satisfies_protocol():
-    tool: ToolPort = MockTool()  # type: ignore[assignment]
-    assert tool.name == "mock_tool"
-
-
 class MockSkills:
     """Minimal mock skills loader that satisfies SkillsPort."""
 
@@ -109,11 +94,6 @@ class MockSkills:
         raise FileNotFoundError(name)
 
 
-def test_mock_memory_satisfies_protocol():
-    memory: MemoryPort = MockMemory()  # type: ignore[assignment]
-    assert memory is not None
-
-
 def test_memory_port_no_summary_or_cursor_methods():
     assert "load_global_summary" not in MemoryPort.__dict__
     assert "save_global_summary" not in MemoryPort.__dict__
@@ -121,6 +101,22 @@ def test_memory_port_no_summary_or_cursor_methods():
     assert "save_global_cursor" not in MemoryPort.__dict__
 
 
-def test_mock_skills_satisfies_protocol():
-    skills: SkillsPort = MockSkills()  # type: ignore[assignment]
-    assert skills.list_skills() == []
+@pytest.mark.parametrize(
+    ("double", "port"),
+    [
+        (MockLLM(), LLMPort),
+        (MockChannel([]), ChannelPort),
+        (MockTool(), ToolPort),
+        (MockMemory(), MemoryPort),
+        (MockSkills(), SkillsPort),
+    ],
+    ids=["llm", "channel", "tool", "memory", "skills"],
+)
+def test_mock_satisfies_protocol(double: object, port: type) -> None:
+    assert isinstance(double, port)
+
+
+async def test_mock_channel_receive_is_iterated_directly() -> None:
+    inbound = InboundMessage(session=Session(channel="cli", sender_id="local"), text="hi")
+    channel = MockChannel([inbound])
+    assert [m async for m in channel.receive()] == [inbound]
@@ -1,3 +1,5 @@
+import pytest
+
 from squidbot.core.models import ToolResult
 from squidbot.core.registry import ToolRegistry
 
@@ -15,6 +17,16 @@ class EchoTool:
         return ToolResult(tool_call_id="", content=text)
 
 
+_ECHO_REGISTRY = ToolRegistry()
+_ECHO_REGISTRY.register(EchoTool())
+
+
+@pytest.fixture
+def echo_registry():
+    """A per-test copy of the module-level EchoTool registry."""
+    return _ECHO_REGISTRY.clone()
+
+
 def test_register_and_list():
     registry = ToolRegistry()
     registry.register(EchoTool())
@@ -23,10 +35,8 @@ def test_register_and_list():
     assert definitions[0].name == "echo"
 
 
-async def test_execute_known_tool():
-    registry = ToolRegistry()
-    registry.register(EchoTool())
-    result = await registry.execute("echo", tool_call_id="tc_1", text="hello")
+async def test_execute_known_tool(echo_registry):
+    result = await echo_registry.execute("echo", tool_call_id="tc_1", text="hello")
     assert result.content == "hello"
     assert result.tool_call_id == "tc_1"
 
@@ -38,9 +48,8 @@ async def test_execute_unknown_tool_returns_error():
     assert "unknown_tool" in result.content
 
 
-def test_get_definitions_caching():
-    registry = ToolRegistry()
-    registry.register(EchoTool())
+def test_get_definitions_caching(echo_registry):
+    registry = echo_registry
 
     # First call builds cache
     defs1 = registry.get_definitions()
@@ -64,3 +73,19 @@ def test_get_definitions_caching():
     defs3 = registry.get_definitions()
     assert len(defs3) == 2
     assert any(d.name == "another" for d in defs3)
+
+
+def test_clone_is_independent_of_original():
+    registry = ToolRegistry()
+    registry.register(EchoTool())
+
+    clone = registry.clone()
+
+    class AnotherTool:
+        name = "another"
+        description = "Another tool"
+        parameters = {"type": "object", "properties": {}}
+
+    clone.register(AnotherTool())
+    assert [d.name for d in registry.get_definitions()] == ["echo"]
+    assert [d.name for d in clone.get_definitions()] == ["echo", "another"]
@@ -3,96 +3,84 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
+
+import pytest
 
 from squidbot.core.models import CronJob
 from squidbot.core.scheduler import is_due, parse_schedule
 
-
-def test_parse_cron_expression():
-    job = CronJob(id="1", name="test", message="hi", schedule="0 9 * * *", channel="cli:local")
-    next_run = parse_schedule(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
-    assert next_run is not None
-    assert next_run.hour == 9
-
-
-def test_parse_interval():
-    job = CronJob(id="1", name="test", message="hi", schedule="every 60", channel="cli:local")
-    next_run = parse_schedule(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
-    assert next_run is not None
-
-
-def test_parse_interval_zero_is_invalid() -> None:
-    job = CronJob(id="1", name="test", message="hi", schedule="every 0", channel="cli:local")
-    next_run = parse_schedule(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
-    assert next_run is None
-
-
-def test_parse_interval_negative_is_invalid() -> None:
-    job = CronJob(id="1", name="test", message="hi", schedule="every -1", channel="cli:local")
-    next_run = parse_schedule(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
-    assert next_run is None
-
-
-def test_parse_interval_one_second_is_valid() -> None:
-    job = CronJob(id="1", name="test", message="hi", schedule="every 1", channel="cli:local")
-    next_run = parse_schedule(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
-    assert next_run is not None
-
-
-def test_is_due_past_time():
-    job = CronJob(
-        id="1",
-        name="test",
-        message="hi",
-        schedule="0 9 * * *",
-        channel="cli:local",
-        last_run=datetime(2026, 2, 21, 8, 0, tzinfo=UTC),
-    )
-    now = datetime(2026, 2, 21, 9, 1, tzinfo=UTC)
-    assert is_due(job, now=now)
-
-
-def test_is_not_due_before_time():
-    job = CronJob(id="1", name="test", message="hi", schedule="0 9 * * *", channel="cli:local")
-    now = datetime(2026, 2, 21, 8, 59, tzinfo=UTC)
-    assert not is_due(job, now=now)
+_NOW = datetime(2026, 2, 21, 8, 0, tzinfo=UTC)
+_AT_0759 = _NOW.replace(hour=7, minute=59)
+_AT_0859 = _NOW.replace(minute=59)
+_AT_0901 = _NOW.replace(hour=9, minute=1)
 
 
-def test_is_not_due_for_zero_interval() -> None:
-    now = datetime(2026, 2, 21, 8, 59, tzinfo=UTC)
-    job = CronJob(
-        id="1",
-        name="test",
-        message="hi",
-        schedule="every 0",
-        channel="cli:local",
-        last_run=now,
+def _job(schedule: str, **overrides: Any) -> CronJob:
+    return CronJob(
+        id="1", name="test", message="hi", schedule=schedule, channel="cli:local", **overrides
     )
-    assert not is_due(job, now=now)
 
 
-def test_is_not_due_for_negative_interval() -> None:
-    now = datetime(2026, 2, 21, 8, 59, tzinfo=UTC)
-    job = CronJob(
-        id="1",
-        name="test",
-        message="hi",
-        schedule="every -1",
-        channel="cli:local",
-        last_run=now,
-    )
-    assert not is_due(job, now=now)
-
+def test_parse_cron_expression():
+    next_run = parse_schedule(_job("0 9 * * *"), now=_NOW)
+    assert next_run is not None
+    assert next_run.hour == 9
 
-def test_is_due_for_fixed_offset_timezone():
-    job = CronJob(
-        id="1",
-        name="test",
-        message="hi",
-        schedule="0 9 * * *",
-        channel="cli:local",
-        timezone="+01:00",
-    )
 
-    assert not is_due(job, now=datetime(2026, 2, 21, 7, 59, tzinfo=UTC))
-    assert is_due(job, now=datetime(2026, 2, 21, 8, 0, tzinfo=UTC))
+@pytest.mark.parametrize(
+    ("schedule", "valid"),
+    [
+        ("every 60", True),
+        ("every 1", True),
+        ("every 0", False),
+        ("every -1", False),
+    ],
+)
+def test_parse_interval(schedule: str, valid: bool) -> None:
+    assert (parse_schedule(_job(schedule), now=_NOW) is not None) is valid
+
+
+@pytest.mark.parametrize(
+    ("job", "now", "expected"),
+    [
+        pytest.param(
+            _job("0 9 * * *", last_run=_NOW),
+            _AT_0901,
+            True,
+            id="cron-past-time",
+        ),
+        pytest.param(
+            _job("0 9 * * *"),
+            _AT_0859,
+            False,
+            id="cron-before-time",
+        ),
+        pytest.param(
+            _job("every 0", last_run=_AT_0859),
+            _AT_0859,
+            False,
+            id="zero-interval",
+        ),
+        pytest.param(
+            _job("every -1", last_run=_AT_0859),
+            _AT_0859,
+            False,
+            id="negative-interval",
+        ),
+        pytest.param(
+            _job("0 9 * * *", timezone="+01:00"),
+            _AT_0759,
+            False,
+            id="fixed-offset-before",
+        ),
+        pytest.param(
+            _job("0 9 * * *", timezone="+01:00"),
+            _NOW,
+            True,
+            id="fixed-offset-at",
+        ),
+    ],
+)
+def test_is_due(job: CronJob, now: datetime, expected: bool) -> None:
+    assert is_due(job, now=now) is expected
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 
 import pytest
 
@@ -10,10 +11,11 @@ from squidbot.adapters.skills.fs import FsSkillsLoader
 from squidbot.core.skills import build_skills_xml
 
 
-@pytest.fixture
-def skill_dir(tmp_path):
-    """Create a temporary skills directory with one skill."""
-    skill = tmp_path / "github"
+@pytest.fixture(scope="module")
+def shared_skill_dir(tmp_path_factory):
+    """A skills directory with one skill, written once per module. Tests must not modify it."""
+    root = tmp_path_factory.mktemp("skills")
+    skill = root / "github"
     skill.mkdir()
     (skill / "SKILL.md").write_text(
         "---\n"
@@ -24,25 +26,31 @@ def skill_dir(tmp_path):
         "  bins: []\n"
         "---\n\n# GitHub Skill\n\nDo stuff with GitHub.\n"
     )
-    return tmp_path
+    return root
 
 
-def test_list_skills_discovers_skill(skill_dir):
-    loader = FsSkillsLoader(search_dirs=[skill_dir])
+@pytest.fixture
+def skill_dir(shared_skill_dir, tmp_path):
+    """A private copy of the shared skills directory for tests that modify it."""
+    return shutil.copytree(shared_skill_dir, tmp_path / "skills")
+
+
+def test_list_skills_discovers_skill(shared_skill_dir):
+    loader = FsSkillsLoader(search_dirs=[shared_skill_dir])
     skills = loader.list_skills()
     assert len(skills) == 1
     assert skills[0].name == "github"
     assert "GitHub" in skills[0].description
 
 
-def test_load_skill_body(skill_dir):
-    loader = FsSkillsLoader(search_dirs=[skill_dir])
+def test_load_skill_body(shared_skill_dir):
+    loader = FsSkillsLoader(search_dirs=[shared_skill_dir])
     body = loader.load_skill_body("github")
     assert "GitHub Skill" in body
 
 
-def test_mtime_cache(skill_dir):
-    loader = FsSkillsLoader(search_dirs=[skill_dir])
+def test_mtime_cache(shared_skill_dir):
+    loader = FsSkillsLoader(search_dirs=[shared_skill_dir])
     skills1 = loader.list_skills()
     skills2 = loader.list_skills()
     # Second call uses cache — same objects
@@ -88,28 +96,28 @@ def test_unavailable_skill_shows_requires(tmp_path):
     assert 'available="false"' in xml
 
 
-def test_list_skills_ttl_cache_hit_skips_scan_work(skill_dir, monkeypatch):
-    loader = FsSkillsLoader(search_dirs=[skill_dir])
+def test_list_skills_ttl_cache_hit_skips_scan_work(shared_skill_dir, monkeypatch):
+    loader = FsSkillsLoader(search_dirs=[shared_skill_dir])
     root_iterdir_calls = 0
     skill_stat_calls = 0
-    original_iterdir = type(skill_dir).iterdir
-    original_stat = type(skill_dir).stat
+    original_iterdir = type(shared_skill_dir).iterdir
+    original_stat = type(shared_skill_dir).stat
     monotonic_values = iter([100.0, 101.0])
 
     def tracked_iterdir(path_obj):
         nonlocal root_iterdir_calls
-        if path_obj == skill_dir:
+        if path_obj == shared_skill_dir:
             root_iterdir_calls += 1
         return original_iterdir(path_obj)
 
     def tracked_stat(path_obj, *args, **kwargs):
         nonlocal skill_stat_calls
-        if path_obj == skill_dir / "github" / "SKILL.md":
+        if path_obj == shared_skill_dir / "github" / "SKILL.md":
             skill_stat_calls += 1
         return original_stat(path_obj, *args, **kwargs)
 
-    monkeypatch.setattr(type(skill_dir), "iterdir", tracked_iterdir)
-    monkeypatch.setattr(type(skill_dir), "stat", tracked_stat)
+    monkeypatch.setattr(type(shared_skill_dir), "iterdir", tracked_iterdir)
+    monkeypatch.setattr(type(shared_skill_dir), "stat", tracked_stat)
     monkeypatch.setattr(
         "squidbot.adapters.skills.fs.time.monotonic", lambda: next(monotonic_values)
     )
@@ -123,9 +131,9 @@ def test_list_skills_ttl_cache_hit_skips_scan_work(skill_dir, monkeypatch):
     assert skill_stat_calls == first_stat_calls
 
 
-def test_load_skill_body_uses_mtime_cache(skill_dir, monkeypatch):
-    loader = FsSkillsLoader(search_dirs=[skill_dir])
-    skill_file = skill_dir / "github" / "SKILL.md"
+def test_load_skill_body_uses_mtime_cache(shared_skill_dir, monkeypatch):
+    loader = FsSkillsLoader(search_dirs=[shared_skill_dir])
+    skill_file = shared_skill_dir / "github" / "SKILL.md"
     read_text_calls = 0
     original_read_text = type(skill_file).read_text
 
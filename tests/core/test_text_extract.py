@@ -2,29 +2,40 @@
 
 from __future__ import annotations
 
+import pytest
+
 from squidbot.core.text_extract import html_to_text
 
 
 class TestHtmlToText:
-    def test_removes_html_tags(self) -> None:
-        result = html_to_text("<p>Hello <b>world</b></p>")
-        assert "Hello" in result
-        assert "world" in result
-        assert "<p>" not in result
-        assert "<b>" not in result
-
-    def test_skips_script_style_and_head_content(self) -> None:
-        html = (
-            "<head><title>Hidden title</title></head>"
-            "<style>body { color: red; }</style>"
-            "<script>alert('x')</script>"
-            "<p>Visible text</p>"
-        )
+    @pytest.mark.parametrize(
+        ("html", "must_contain", "must_not_contain"),
+        [
+            pytest.param(
+                "<p>Hello <b>world</b></p>",
+                ["Hello", "world"],
+                ["<p>", "<b>"],
+                id="removes-html-tags",
+            ),
+            pytest.param(
+                "<head><title>Hidden title</title></head>"
+                "<style>body { color: red; }</style>"
+                "<script>alert('x')</script>"
+                "<p>Visible text</p>",
+                ["Visible text"],
+                ["Hidden title", "alert", "color"],
+                id="skips-script-style-and-head-content",
+            ),
+        ],
+    )
+    def test_extracts_visible_text(
+        self, html: str, must_contain: list[str], must_not_contain: list[str]
+    ) -> None:
         result = html_to_text(html)
-        assert "Visible text" in result
-        assert "Hidden title" not in result
-        assert "alert" not in result
-        assert "color" not in result
+        for text in must_contain:
+            assert text in result
+        for text in must_not_contain:
+            assert text not in result
 
     def test_unescapes_html_entities(self) -> None:
         result = html_to_text("Fish &amp; Chips &lt;3")